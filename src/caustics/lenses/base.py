@@ -90,11 +90,9 @@ class Lens(Module):
         lens equation. Individual lenses may implement more efficient methods.
         """
         A = self.jacobian_lens_equation(x, y, z_s, method=method, pixelscale=pixelscale)
-        I = torch.eye(2, device=A.device, dtype=A.dtype).reshape(  # noqa E741
-            *[1] * len(A.shape[:-2]), 2, 2
-        )
-        negPsi = 0.5 * (A[..., 0, 0] + A[..., 1, 1]).unsqueeze(-1).unsqueeze(-1) * I - A
-        return 0.5 * (negPsi[..., 0, 0] - negPsi[..., 1, 1]), negPsi[..., 0, 1]
+        # Work on the Jacobian components directly rather than building the
+        # traceless (2,2) matrix 0.5 * tr(A) * I - A
+        return 0.5 * (A[..., 1, 1] - A[..., 0, 0]), -A[..., 0, 1]
 
     @forward
     def magnification(
@@ -102,6 +100,7 @@ class Lens(Module):
         x: Tensor,
         y: Tensor,
         z_s: Tensor,
+        chunk_size: Optional[int] = None,
     ) -> Tensor:
         """
         Compute the gravitational magnification at the given coordinates.
@@ -126,6 +125,10 @@ class Lens(Module):
         params: Packed, optional
             Dynamic parameter container for the lens model. Defaults to None.
 
+        chunk_size: Optional[int]
+            Number of points to evaluate per vectorized call. Defaults to
+            None, evaluating all points at once.
+
         Returns
         -------
         Tensor
@@ -134,7 +137,62 @@ class Lens(Module):
             *Unit: unitless*
 
         """
-        return magnification(self.raytrace, x, y, z_s)
+        return magnification(self.raytrace, x, y, z_s, chunk_size=chunk_size)
+
+    @forward
+    def raytrace_batched(
+        self,
+        x: Tensor,
+        y: Tensor,
+        z_s: Tensor,
+        chunk_size: Optional[int] = None,
+    ) -> tuple[Tensor, Tensor]:
+        """
+        Ray trace the same coordinates to several source redshifts at once.
+        This vectorizes `raytrace` over the leading dimension of `z_s`.
+
+        Parameters
+        ----------
+        x: Tensor
+            Tensor of x coordinates in the lens plane.
+
+            *Unit: arcsec*
+
+        y: Tensor
+            Tensor of y coordinates in the lens plane.
+
+            *Unit: arcsec*
+
+        z_s: Tensor
+            1D tensor of source redshifts.
+
+            *Unit: unitless*
+
+        params: Packed, optional
+            Dynamic parameter container for the lens model. Defaults to None.
+
+        chunk_size: Optional[int]
+            Number of source redshifts to evaluate per vectorized call.
+            Defaults to None, evaluating all redshifts at once.
+
+        Returns
+        -------
+        x_component: Tensor
+            x coordinates on each source plane, with a leading dimension
+            matching `z_s`.
+
+            *Unit: arcsec*
+
+        y_component: Tensor
+            y coordinates on each source plane, with a leading dimension
+            matching `z_s`.
+
+            *Unit: arcsec*
+
+        """
+        return torch.vmap(
+            self.raytrace, in_dims=(None, None, 0), chunk_size=chunk_size
+        )(x, y, z_s)
 
     @forward
     def forward_raytrace(
@@ -224,6 +282,12 @@ class ThickLens(Lens):
         the cosmological parameters of the model.
     """
 
+    def __init__(self, cosmology: CosmologyType, name: NameType = None):
+        super().__init__(cosmology, name=name)
+        # Only warn about reduced_deflection_angle on first use, it is
+        # otherwise called repeatedly in hot loops such as sampling
+        self._warned_reduced_deflection_angle = False
+
     @forward
     def reduced_deflection_angle(
         self,
@@ -258,15 +322,17 @@ class ThickLens(Lens):
         ------
         NotImplementedError
         """
-        warnings.warn(
-            "ThickLens objects do not have a reduced deflection angle "
-            "since they have no unique lens redshift. "
-            "The distance D_{ls} is undefined in the equation "
-            "$\\alpha_{reduced} = \\frac{D_{ls}}{D_s}\\alpha_{physical}$."
-            "See `effective_reduced_deflection_angle`. "
-            "Now using effective_reduced_deflection_angle, "
-            "please switch functions to remove this warning"
-        )
+        if not self._warned_reduced_deflection_angle:
+            warnings.warn(
+                "ThickLens objects do not have a reduced deflection angle "
+                "since they have no unique lens redshift. "
+                "The distance D_{ls} is undefined in the equation "
+                "$\\alpha_{reduced} = \\frac{D_{ls}}{D_s}\\alpha_{physical}$."
+                "See `effective_reduced_deflection_angle`. "
+                "Now using effective_reduced_deflection_angle, "
+                "please switch functions to remove this warning"
+            )
+            self._warned_reduced_deflection_angle = True
         return self.effective_reduced_deflection_angle(x, y, z_s, **kwargs)
 
     @forward
@@ -513,7 +579,7 @@ class ThickLens(Lens):
         ax, ay = self.effective_reduced_deflection_angle(x, y, z_s)
 
         # Build Jacobian
-        J = torch.zeros((*ax.shape, 2, 2), device=ax.device, dtype=ax.dtype)
+        J = torch.empty((*ax.shape, 2, 2), device=ax.device, dtype=ax.dtype)
         J[..., 0, 1], J[..., 0, 0] = torch.gradient(ax, spacing=pixelscale)
         J[..., 1, 1], J[..., 1, 0] = torch.gradient(ay, spacing=pixelscale)
         return J
@@ -531,38 +597,17 @@ class ThickLens(Lens):
         This equates to a (2,2) matrix at each (x,y) point.
         """
 
-        # Build Jacobian
-        J = torch.zeros((*x.shape, 2, 2), device=x.device, dtype=x.dtype)
-
-        # Compute deflection angle gradients
-        dax_dx = torch.func.grad(
-            lambda *a: self.effective_reduced_deflection_angle(*a)[0], argnums=0
-        )
-        J[..., 0, 0] = torch.vmap(dax_dx, in_dims=(0, 0, None), chunk_size=chunk_size)(
-            x.flatten(), y.flatten(), z_s
-        ).reshape(x.shape)
-
-        dax_dy = torch.func.grad(
-            lambda *a: self.effective_reduced_deflection_angle(*a)[0], argnums=1
-        )
-        J[..., 0, 1] = torch.vmap(dax_dy, in_dims=(0, 0, None), chunk_size=chunk_size)(
-            x.flatten(), y.flatten(), z_s
-        ).reshape(x.shape)
-
-        day_dx = torch.func.grad(
-            lambda *a: self.effective_reduced_deflection_angle(*a)[1], argnums=0
+        # Compute all deflection angle gradients in a single forward-mode pass
+        jac = torch.func.jacfwd(
+            lambda *a: torch.stack(self.effective_reduced_deflection_angle(*a)),
+            argnums=(0, 1),
         )
-        J[..., 1, 0] = torch.vmap(day_dx, in_dims=(0, 0, None), chunk_size=chunk_size)(
+        J = torch.vmap(jac, in_dims=(0, 0, None), chunk_size=chunk_size)(
             x.flatten(), y.flatten(), z_s
-        ).reshape(x.shape)
-
-        day_dy = torch.func.grad(
-            lambda *a: self.effective_reduced_deflection_angle(*a)[1], argnums=1
         )
-        J[..., 1, 1] = torch.vmap(day_dy, in_dims=(0, 0, None), chunk_size=chunk_size)(
-            x.flatten(), y.flatten(), z_s
-        ).reshape(x.shape)
 
+        # Build Jacobian
+        J = torch.stack(J, dim=-1).reshape(*x.shape, 2, 2)
         return J.detach()
 
     @forward
@@ -616,7 +661,7 @@ class ThickLens(Lens):
         J = self._jacobian_effective_deflection_angle_finitediff(
             x, y, z_s, pixelscale, **kwargs
         )
-        return torch.eye(2).to(J.device) - J
+        return torch.eye(2, device=J.device, dtype=J.dtype) - J
 
     @forward
     def _jacobian_lens_equation_autograd(
@@ -632,7 +677,7 @@ class ThickLens(Lens):
         """
         # Build Jacobian
         J = self._jacobian_effective_deflection_angle_autograd(x, y, z_s, **kwargs)
-        return torch.eye(2).to(J.device) - J.detach()
+        return torch.eye(2, device=J.device, dtype=J.dtype) - J
 
     @forward
     def effective_convergence_div(
@@ -808,6 +853,17 @@ class ThinLens(Lens):
         """
         d_s = self.cosmology.angular_diameter_distance(z_s)
         d_ls = self.cosmology.angular_diameter_distance_z1z2(z_l, z_s)
+        return self._physical_deflection_angle(x, y, z_s, d_s, d_ls)
+
+    def _physical_deflection_angle(self, x, y, z_s, d_s, d_ls):
+        """
+        This method is used by
+        :func:`caustics.lenses.ThinLens.physical_deflection_angle` and
+        :func:`caustics.lenses.ThinLens.time_delay` to compute the physical
+        deflection angle from already computed source and lens-source angular
+        diameter distances. Lenses which compute the physical deflection angle
+        directly override this to ignore the distances.
+        """
         deflection_angle_x, deflection_angle_y = self.reduced_deflection_angle(
             x, y, z_s
         )
@@ -991,15 +1047,16 @@ class ThinLens(Lens):
         ax, ay = self.reduced_deflection_angle(x, y, z_s, **kwargs)
         return x - ax, y - ay
 
-    def _arcsec2_to_days(self, z_l, z_s):
+    def _angular_diameter_distances(self, z_l, z_s):
         """
         This method is used by :func:`caustics.lenses.ThinLens.time_delay` to
-        convert arcsec^2 to days in the context of gravitational time delays.
+        compute the lens, source, and lens-source angular diameter distances
+        once so they can be shared by every term of the time delay.
         """
         d_l = self.cosmology.angular_diameter_distance(z_l)
         d_s = self.cosmology.angular_diameter_distance(z_s)
         d_ls = self.cosmology.angular_diameter_distance_z1z2(z_l, z_s)
-        return func.time_delay_arcsec2_to_days(d_l, d_s, d_ls, z_l)
+        return d_l, d_s, d_ls
 
     @forward
     def time_delay(
@@ -1070,17 +1127,19 @@ class ThinLens(Lens):
         1. Irwin I. Shapiro (1964). "Fourth Test of General Relativity". Physical Review Letters. 13 (26): 789-791
         2. Refsdal, S. (1964). "On the possibility of determining Hubble's parameter and the masses of galaxies from the gravitational lens effect". Monthly Notices of the Royal Astronomical Society. 128 (4): 307-310.
         """
-        TD = torch.zeros_like(x)
+        d_l, d_s, d_ls = self._angular_diameter_distances(z_l, z_s)
 
         if shapiro_time_delay:
-            potential = self.potential(x, y, z_s)
-            TD = TD - potential
+            TD = -self.potential(x, y, z_s)
+        else:
+            TD = torch.zeros_like(x)
         if geometric_time_delay:
-            ax, ay = self.physical_deflection_angle(x, y, z_s)
-            fp = 0.5 * (ax**2 + ay**2)
-            TD = TD + fp
+            ax, ay = self._physical_deflection_angle(x, y, z_s, d_s, d_ls)
+            # Accumulate 0.5 * |alpha|^2 with fused multiply-adds
+            TD = torch.addcmul(TD, ax, ax, value=0.5)
+            TD = torch.addcmul(TD, ay, ay, value=0.5)
 
-        factor = self._arcsec2_to_days(z_l, z_s)
+        factor = func.time_delay_arcsec2_to_days(d_l, d_s, d_ls, z_l)
 
         return factor * TD
 
@@ -1100,7 +1159,7 @@ class ThinLens(Lens):
         ax, ay = self.reduced_deflection_angle(x, y, z_s)
 
         # Build Jacobian
-        J = torch.zeros((*ax.shape, 2, 2), device=ax.device, dtype=ax.dtype)
+        J = torch.empty((*ax.shape, 2, 2), device=ax.device, dtype=ax.dtype)
         J[..., 0, 1], J[..., 0, 0] = torch.gradient(ax, spacing=pixelscale)
         J[..., 1, 1], J[..., 1, 0] = torch.gradient(ay, spacing=pixelscale)
         return J
@@ -1117,38 +1176,16 @@ class ThinLens(Lens):
         Return the jacobian of the deflection angle vector.
         This equates to a (2,2) matrix at each (x,y) point.
         """
-        # Build Jacobian
-        J = torch.zeros((*x.shape, 2, 2), device=x.device, dtype=x.dtype)
-
-        # Compute deflection angle gradients
-        dax_dx = torch.func.grad(
-            lambda *a: self.reduced_deflection_angle(*a)[0], argnums=0
+        # Compute all deflection angle gradients in a single forward-mode pass
+        jac = torch.func.jacfwd(
+            lambda *a: torch.stack(self.reduced_deflection_angle(*a)), argnums=(0, 1)
         )
-        J[..., 0, 0] = torch.vmap(dax_dx, in_dims=(0, 0, None), chunk_size=chunk_size)(
+        J = torch.vmap(jac, in_dims=(0, 0, None), chunk_size=chunk_size)(
             x.flatten(), y.flatten(), z_s
-        ).reshape(x.shape)
-
-        dax_dy = torch.func.grad(
-            lambda *a: self.reduced_deflection_angle(*a)[0], argnums=1
         )
-        J[..., 0, 1] = torch.vmap(dax_dy, in_dims=(0, 0, None), chunk_size=chunk_size)(
-            x.flatten(), y.flatten(), z_s
-        ).reshape(x.shape)
-
-        day_dx = torch.func.grad(
-            lambda *a: self.reduced_deflection_angle(*a)[1], argnums=0
-        )
-        J[..., 1, 0] = torch.vmap(day_dx, in_dims=(0, 0, None), chunk_size=chunk_size)(
-            x.flatten(), y.flatten(), z_s
-        ).reshape(x.shape)
-
-        day_dy = torch.func.grad(
-            lambda *a: self.reduced_deflection_angle(*a)[1], argnums=1
-        )
-        J[..., 1, 1] = torch.vmap(day_dy, in_dims=(0, 0, None), chunk_size=chunk_size)(
-            x.flatten(), y.flatten(), z_s
-        ).reshape(x.shape)
 
+        # Build Jacobian
+        J = torch.stack(J, dim=-1).reshape(*x.shape, 2, 2)
         return J.detach()
 
     @forward
@@ -1195,7 +1232,7 @@ class ThinLens(Lens):
         """
         # Build Jacobian
         J = self._jacobian_deflection_angle_finitediff(x, y, z_s, pixelscale, **kwargs)
-        return torch.eye(2).to(J.device) - J
+        return torch.eye(2, device=J.device, dtype=J.dtype) - J
 
     @forward
     def _jacobian_lens_equation_autograd(
@@ -1211,4 +1248,4 @@ class ThinLens(Lens):
         """
         # Build Jacobian
         J = self._jacobian_deflection_angle_autograd(x, y, z_s, **kwargs)
-        return torch.eye(2).to(J.device) - J.detach()
+        return torch.eye(2, device=J.device, dtype=J.dtype) - J
@@ -179,6 +179,13 @@ class EnclosedMass(ThinLens):
             x0, y0, q, phi, lambda r: self.enclosed_mass(r, p), x, y, self.s
         )
 
+    def _physical_deflection_angle(self, x, y, z_s, d_s, d_ls):
+        """
+        The physical deflection angle is computed directly for this lens, so
+        the precomputed distances are not needed.
+        """
+        return self.physical_deflection_angle(x, y, z_s)
+
     @forward
     def potential(
         self,
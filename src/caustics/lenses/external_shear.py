@@ -5,6 +5,7 @@ from torch import Tensor
 import torch
 from caskade import forward, Param
 
+from ..utils import _compiled
 from .base import ThinLens, CosmologyType, NameType, ZLType
 from . import func
 
@@ -38,6 +39,11 @@ class ExternalShear(ThinLens):
 
         *Unit: unitless*
 
+    use_torch_compile: bool
+        If True, the deflection angle and potential kernels are compiled with
+        `torch.compile`, fusing them into a single kernel per call. The first
+        call is slow while the kernels compile. Default is False.
+
     Notes
     ------
     The shear components gamma_1 and gamma_2 represent an external shear, a gravitational
@@ -74,6 +80,10 @@ class ExternalShear(ThinLens):
         s: Annotated[
             float, "Softening length for the elliptical power-law profile"
         ] = 0.0,
+        use_torch_compile: Annotated[
+            bool,
+            "If True, compiles the deflection angle and potential with `torch.compile`",
+        ] = False,
         name: NameType = None,
     ):
         super().__init__(cosmology, z_l, name=name)
@@ -84,6 +94,8 @@ class ExternalShear(ThinLens):
         self.gamma_2 = Param("gamma_2", gamma_2, units="unitless")
         self.s = s
 
+        self.use_torch_compile = use_torch_compile
+
     @forward
     def reduced_deflection_angle(
         self,
@@ -131,9 +143,12 @@ class ExternalShear(ThinLens):
             *Unit: arcsec*
 
         """
-        return func.reduced_deflection_angle_external_shear(
-            x0, y0, gamma_1, gamma_2, x, y
-        )
+        fn = func.reduced_deflection_angle_external_shear
+        if self.use_torch_compile:
+            # Fuse the handful of elementwise ops into a single kernel. Dynamic
+            # shapes avoid recompiling whenever the grid size changes.
+            fn = _compiled(fn, dynamic=True)
+        return fn(x0, y0, gamma_1, gamma_2, x, y)
 
     @forward
     def potential(
@@ -177,7 +192,10 @@ class ExternalShear(ThinLens):
             *Unit: arcsec^2*
 
         """
-        return func.potential_external_shear(x0, y0, gamma_1, gamma_2, x, y)
+        fn = func.potential_external_shear
+        if self.use_torch_compile:
+            fn = _compiled(fn, dynamic=True)
+        return fn(x0, y0, gamma_1, gamma_2, x, y)
 
     @forward
     def convergence(
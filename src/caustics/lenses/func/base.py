@@ -3,6 +3,10 @@ import torch
 from ...utils import batch_lm
 from ...constants import arcsec_to_rad, c_Mpc_s, days_to_seconds
 
+# Constant part of the arcsec^2 to days time delay conversion, folded into a
+# single scalar so it is applied with one multiplication
+_arcsec2_s_Mpc_to_days = arcsec_to_rad**2 / (c_Mpc_s * days_to_seconds)
+
 
 def triangle_contains(p, v):
     """
@@ -252,7 +256,8 @@ def physical_from_reduced_deflection_angle(ax, ay, d_s, d_ls):
 
     """
 
-    return (d_s / d_ls) * ax, (d_s / d_ls) * ay
+    ratio = d_s / d_ls
+    return ratio * ax, ratio * ay
 
 
 def reduced_from_physical_deflection_angle(ax, ay, d_s, d_ls):
@@ -295,7 +300,8 @@ def reduced_from_physical_deflection_angle(ax, ay, d_s, d_ls):
 
     """
 
-    return (d_ls / d_s) * ax, (d_ls / d_s) * ay
+    ratio = d_ls / d_s
+    return ratio * ax, ratio * ay
 
 
 def time_delay_arcsec2_to_days(d_l, d_s, d_ls, z_l):
@@ -304,4 +310,4 @@ def time_delay_arcsec2_to_days(d_l, d_s, d_ls, z_l):
     the time delay (i.e. potential and deflection angle squared terms) from
     arcsec^2 to units of days.
     """
-    return (1 + z_l) / c_Mpc_s * d_s * d_l / d_ls * arcsec_to_rad**2 / days_to_seconds
+    return (1 + z_l) * d_s * d_l / d_ls * _arcsec2_s_Mpc_to_days
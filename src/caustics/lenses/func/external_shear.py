@@ -51,7 +51,8 @@ def reduced_deflection_angle_external_shear(x0, y0, gamma_1, gamma_2, x, y):
         *Unit: arcsec*
 
     """
-    # Derivatives of Meneghetti eq 3.80
+    # Derivatives of Meneghetti eq 3.80, i.e. alpha = gamma * conj(z) with
+    # gamma = gamma_1 + i gamma_2 and z = x + i y, kept in real arithmetic
     x, y = translate_rotate(x, y, x0, y0)
     ax = gamma_1 * x + gamma_2 * y
     ay = gamma_2 * x - gamma_1 * y
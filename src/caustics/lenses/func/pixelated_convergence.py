@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 import torch
 import torch.nn.functional as F
 from scipy.fft import next_fast_len
@@ -36,7 +38,8 @@ def build_kernels_pixelated_convergence(pixelscale, n_pix):
     """
     x_mg, y_mg = meshgrid(pixelscale, 2 * n_pix)
 
-    d2 = x_mg**2 + y_mg**2
+    # Square the 1D axes and broadcast rather than squaring the full grids
+    d2 = x_mg[:1] ** 2 + y_mg[:, :1] ** 2
     potential_kernel = safe_log(d2.sqrt())
     ax_kernel = safe_divide(x_mg, d2)
     ay_kernel = safe_divide(y_mg, d2)
@@ -64,22 +67,20 @@ def build_window_pixelated_convergence(window, kernel_shape):
         The window to multiply with the kernel.
 
     """
-    x, y = torch.meshgrid(
-        torch.linspace(-1, 1, kernel_shape[-1]),
-        torch.linspace(-1, 1, kernel_shape[-2]),
-        indexing="xy",
-    )
+    x = torch.linspace(-1, 1, kernel_shape[-1]).view(1, -1)
+    y = torch.linspace(-1, 1, kernel_shape[-2]).view(-1, 1)
     r = (x**2 + y**2).sqrt()
     return torch.clip((1 - r) / window, 0, 1)
 
 
+@lru_cache(maxsize=32)
 def _fft_size(n_pix):
     pad = 2 * n_pix
     pad = next_fast_len(pad)
     return pad, pad
 
 
-def _fft2_padded(x, n_pix, padding: str):
+def _fft2_padded(x, n_pix, padding: str, fft_size=None):
     """
     Compute the 2D FFT of a tensor with padding.
 
@@ -91,6 +92,9 @@ def _fft2_padded(x, n_pix, padding: str):
     padding: str
         The type of padding to use.
 
+    fft_size: tuple[int, int], optional
+        The padded FFT shape. Computed with ``_fft_size(n_pix)`` if not given.
+
     Returns
     -------
     Tensor
@@ -107,10 +111,12 @@ def _fft2_padded(x, n_pix, padding: str):
     else:
         raise ValueError(f"Invalid padding type: {padding}")
 
-    return torch.fft.rfft2(x, _fft_size(n_pix))
+    if fft_size is None:
+        fft_size = _fft_size(n_pix)
+    return torch.fft.rfft2(x, fft_size)
 
 
-def _unpad_fft(x, n_pix):
+def _unpad_fft(x, n_pix, fft_size=None):
     """
     Unpad the FFT of a tensor.
 
@@ -119,14 +125,20 @@ def _unpad_fft(x, n_pix):
     x: Tensor
         The input tensor.
 
+    fft_size: tuple[int, int], optional
+        The padded FFT shape. Computed with ``_fft_size(n_pix)`` if not given.
+
     Returns
     -------
     Tensor
         The unpaded FFT of the input tensor.
 
     """
-    _s = _fft_size(n_pix)
-    return torch.roll(x, (-_s[0] // 2, -_s[1] // 2), dims=(-2, -1))[..., : n_pix, : n_pix]  # fmt: skip
+    _s = _fft_size(n_pix) if fft_size is None else fft_size
+    # Equivalent to rolling by half the padded size and cropping to n_pix, but
+    # since n_pix <= _s // 2 the cropped region never wraps, so a view suffices
+    i0, j0 = (_s[0] + 1) // 2, (_s[1] + 1) // 2
+    return x[..., i0 : i0 + n_pix, j0 : j0 + n_pix]
 
 
 def reduced_deflection_angle_pixelated_convergence(
@@ -142,6 +154,8 @@ def reduced_deflection_angle_pixelated_convergence(
     n_pix,
     padding,
     convolution_mode="fft",
+    fft_dtype=None,
+    fft_size=None,
 ):
     """
     Compute the reduced deflection angle for a pixelated convergence map. This
@@ -206,18 +220,29 @@ def reduced_deflection_angle_pixelated_convergence(
 
     convolution_mode: str
         The mode of convolution to use. Either "fft" or "conv2d".
+
+    fft_dtype: torch.dtype, optional
+        If given, the FFT convolution is computed in this (real) dtype and the
+        resulting maps are cast back to the dtype of ``x``. The kernels should
+        already be transformed at this precision. Ignored for "conv2d".
+
+    fft_size: tuple[int, int], optional
+        The padded FFT shape. Computed with ``_fft_size(n_pix)`` if not given.
+        Passing it in keeps the cached size lookup out of compiled code.
     """
-    _s = _fft_size(n_pix)
+    _s = _fft_size(n_pix) if fft_size is None else fft_size
     if convolution_mode == "fft":
-        convergence_tilde = _fft2_padded(convergence_map, n_pix, padding)
-        deflection_angle_x = torch.fft.irfft2(
-            convergence_tilde * ax_kernel, _s
-        ).real * (pixelscale**2 / torch.pi)
-        deflection_angle_y = torch.fft.irfft2(
-            convergence_tilde * ay_kernel, _s
-        ).real * (pixelscale**2 / torch.pi)
-        deflection_angle_x_map = _unpad_fft(deflection_angle_x, n_pix)
-        deflection_angle_y_map = _unpad_fft(deflection_angle_y, n_pix)
+        if fft_dtype is not None:
+            convergence_map = convergence_map.to(fft_dtype)
+        convergence_tilde = _fft2_padded(convergence_map, n_pix, padding, _s)
+        deflection_angle_x = torch.fft.irfft2(convergence_tilde * ax_kernel, _s) * (
+            pixelscale**2 / torch.pi
+        )
+        deflection_angle_y = torch.fft.irfft2(convergence_tilde * ay_kernel, _s) * (
+            pixelscale**2 / torch.pi
+        )
+        deflection_angle_x_map = _unpad_fft(deflection_angle_x, n_pix, _s).to(x.dtype)
+        deflection_angle_y_map = _unpad_fft(deflection_angle_y, n_pix, _s).to(x.dtype)
     elif convolution_mode == "conv2d":
         convergence_map_flipped = convergence_map.flip((-1, -2))[None, None]
         # noqa: E501 F.pad(, ((pad - self.n_pix)//2, (pad - self.n_pix)//2, (pad - self.n_pix)//2, (pad - self.n_pix)//2), mode = self.padding_mode)
@@ -254,6 +279,8 @@ def potential_pixelated_convergence(
     n_pix,
     padding,
     convolution_mode="fft",
+    fft_dtype=None,
+    fft_size=None,
 ):
     """
     Compute the lensing potential for a pixelated convergence map. This follows
@@ -313,14 +340,25 @@ def potential_pixelated_convergence(
 
     convolution_mode: str
         The mode of convolution to use. Either "fft" or "conv2d".
+
+    fft_dtype: torch.dtype, optional
+        If given, the FFT convolution is computed in this (real) dtype and the
+        resulting maps are cast back to the dtype of ``x``. The kernels should
+        already be transformed at this precision. Ignored for "conv2d".
+
+    fft_size: tuple[int, int], optional
+        The padded FFT shape. Computed with ``_fft_size(n_pix)`` if not given.
+        Passing it in keeps the cached size lookup out of compiled code.
     """
-    _s = _fft_size(n_pix)
+    _s = _fft_size(n_pix) if fft_size is None else fft_size
     if convolution_mode == "fft":
-        convergence_tilde = _fft2_padded(convergence_map, n_pix, padding)
+        if fft_dtype is not None:
+            convergence_map = convergence_map.to(fft_dtype)
+        convergence_tilde = _fft2_padded(convergence_map, n_pix, padding, _s)
         potential = torch.fft.irfft2(convergence_tilde * potential_kernel, _s) * (
             pixelscale**2 / torch.pi
         )
-        potential_map = _unpad_fft(potential, n_pix)
+        potential_map = _unpad_fft(potential, n_pix, _s).to(x.dtype)
     elif convolution_mode == "conv2d":
         convergence_map_flipped = convergence_map.flip((-1, -2))[None, None]
         potential_map = F.conv2d(
@@ -91,11 +91,12 @@ class Multiplane(ThickLens):
             D = self.cosmology.transverse_comoving_distance_z1z2(z_ls[i], z_next)
             D_is = self.cosmology.transverse_comoving_distance_z1z2(z_ls[i], z_s)
             D_next = self.cosmology.transverse_comoving_distance(z_next)
-            alpha_x, alpha_y = self.lenses[i].physical_deflection_angle(
-                X * rad_to_arcsec / D_l,
-                Y * rad_to_arcsec / D_l,
-                z_s,
-            )
+
+            # Angular position of the rays on this lens plane, computed once
+            # and shared by the deflection angle and potential
+            scale = rad_to_arcsec / D_l
+            x_l, y_l = X * scale, Y * scale
+            alpha_x, alpha_y = self.lenses[i].physical_deflection_angle(x_l, y_l, z_s)
 
             # Update angle of rays after passing through lens (sum in eq 18)
             theta_x = theta_x - alpha_x
@@ -105,23 +106,23 @@ class Multiplane(ThickLens):
             tau_ij = (1 + z_ls[i]) * D_l * D_next / (D * c_Mpc_s) / days_to_seconds
             if shapiro_time_delay:
                 beta_ij = D * D_s / (D_next * D_is)
-                potential = self.lenses[i].potential(
-                    X * rad_to_arcsec / D_l, Y * rad_to_arcsec / D_l, z_s
-                )
+                potential = self.lenses[i].potential(x_l, y_l, z_s)
                 TD += (-tau_ij * beta_ij * arcsec_to_rad**2) * potential
             if geometric_time_delay:
                 TD += (tau_ij * arcsec_to_rad**2 * 0.5) * (alpha_x**2 + alpha_y**2)
 
             # Propagate rays to next plane (basically eq 18)
-            X = X + D * theta_x * arcsec_to_rad
-            Y = Y + D * theta_y * arcsec_to_rad
+            step = D * arcsec_to_rad
+            X = X + step * theta_x
+            Y = Y + step * theta_y
 
         # Convert from physical position to angular position on the source plane
         D_end = self.cosmology.transverse_comoving_distance(z_s)
+        scale = rad_to_arcsec / D_end
         if ray_coords and not (shapiro_time_delay or geometric_time_delay):
-            return X * rad_to_arcsec / D_end, Y * rad_to_arcsec / D_end
+            return X * scale, Y * scale
         elif ray_coords and (shapiro_time_delay or geometric_time_delay):
-            return X * rad_to_arcsec / D_end, Y * rad_to_arcsec / D_end, TD
+            return X * scale, Y * scale, TD
         elif shapiro_time_delay or geometric_time_delay:
             return TD
         raise ValueError(
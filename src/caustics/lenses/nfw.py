@@ -303,6 +303,13 @@ class NFW(ThinLens):
             x0, y0, m, c, critical_density, d_l, x, y, _h=self._h, DELTA=DELTA, s=self.s
         )
 
+    def _physical_deflection_angle(self, x, y, z_s, d_s, d_ls):
+        """
+        The physical deflection angle is computed directly for this lens, so
+        the precomputed distances are not needed.
+        """
+        return self.physical_deflection_angle(x, y, z_s)
+
     @forward
     def convergence(
         self,
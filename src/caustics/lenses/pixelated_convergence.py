@@ -6,7 +6,7 @@ from torch import Tensor
 import numpy as np
 from caskade import forward, Param
 
-from ..utils import interp2d
+from ..utils import interp2d, _compiled
 from .base import ThinLens, CosmologyType, NameType, ZLType
 from . import func
 
@@ -56,6 +56,14 @@ class PixelatedConvergence(ThinLens):
             "Specifies the type of padding",
         ] = "zero",
         window_kernel: Annotated[float, "Amount of kernel to be windowed"] = 1.0 / 8.0,
+        use_torch_compile: Annotated[
+            bool,
+            "If True, compiles the deflection angle and potential with `torch.compile`",
+        ] = False,
+        low_precision_fft: Annotated[
+            bool,
+            "If True, computes the FFT convolution in single precision",
+        ] = False,
         name: NameType = None,
     ):
         """Strong lensing with user provided kappa map
@@ -129,6 +137,27 @@ class PixelatedConvergence(ThinLens):
             zero for the purpose of FFT stability. Set to 0 for no windowing.
             Default is 1/8.
 
+        use_torch_compile: bool, optional
+            If True, the deflection angle and potential calculations are
+            compiled with `torch.compile` using static shapes. The compiled
+            functions are shared by all `PixelatedConvergence` instances, and
+            every new combination of convergence map size, padding and
+            coordinate shape (e.g. a full grid versus the per-point calls made
+            when computing the magnification) triggers a recompile. Past
+            dynamo's recompile limit, further shapes silently run eagerly, so
+            this is best suited to repeatedly evaluating a few fixed grids.
+            The first call for each shape is slow while the code compiles.
+            Default is False.
+
+        low_precision_fft: bool, optional
+            If True, the FFT convolution is computed in float32 (complex64)
+            even when the lens and coordinates are in float64, and the
+            resulting maps are cast back before interpolation. Double
+            precision FFTs are much slower on most GPUs, while the
+            convolution is typically limited by the pixelization rather than
+            by floating point error. Only affects the "fft" convolution mode.
+            Default is False.
+
         """
 
         super().__init__(cosmology, z_l, name=name)
@@ -154,6 +183,7 @@ class PixelatedConvergence(ThinLens):
         self.fov = self.n_pix * self.pixelscale
         self.use_next_fast_len = use_next_fast_len
         self.padding = padding
+        self.fft_dtype = torch.float32 if low_precision_fft else None
 
         # Construct kernels
         self.ax_kernel, self.ay_kernel, self.potential_kernel = (
@@ -170,11 +200,13 @@ class PixelatedConvergence(ThinLens):
         self.potential_kernel_tilde = None
         self.ax_kernel_tilde = None
         self.ay_kernel_tilde = None
-        self._s = None
+        self._s = func._fft_size(self.n_pix)
 
         # Triggers creation of FFTs of kernels
         self.convolution_mode = convolution_mode
 
+        self.use_torch_compile = use_torch_compile
+
     def to(
         self, device: Optional[torch.device] = None, dtype: Optional[torch.dtype] = None
     ):
@@ -228,13 +260,13 @@ class PixelatedConvergence(ThinLens):
         if convolution_mode == "fft":
             # Create FFTs of kernels
             self.potential_kernel_tilde = torch.fft.rfft2(
-                self.potential_kernel, func._fft_size(self.n_pix)
+                self.potential_kernel.to(dtype=self.fft_dtype), self._s
             )
             self.ax_kernel_tilde = torch.fft.rfft2(
-                self.ax_kernel, func._fft_size(self.n_pix)
+                self.ax_kernel.to(dtype=self.fft_dtype), self._s
             )
             self.ay_kernel_tilde = torch.fft.rfft2(
-                self.ay_kernel, func._fft_size(self.n_pix)
+                self.ay_kernel.to(dtype=self.fft_dtype), self._s
             )
         elif convolution_mode == "conv2d":
             # Drop FFTs of kernels
@@ -292,7 +324,11 @@ class PixelatedConvergence(ThinLens):
             *Unit: arcsec*
 
         """
-        return func.reduced_deflection_angle_pixelated_convergence(
+        fn = func.reduced_deflection_angle_pixelated_convergence
+        if self.use_torch_compile:
+            # Static shapes: each new map or coordinate shape recompiles
+            fn = _compiled(fn, dynamic=False)
+        return fn(
             x0,
             y0,
             convergence_map,
@@ -305,6 +341,8 @@ class PixelatedConvergence(ThinLens):
             self.n_pix,
             self.padding,
             self.convolution_mode,
+            self.fft_dtype,
+            self._s,
         )
 
     @forward
@@ -348,7 +386,10 @@ class PixelatedConvergence(ThinLens):
             *Unit: arcsec^2*
 
         """
-        return func.potential_pixelated_convergence(
+        fn = func.potential_pixelated_convergence
+        if self.use_torch_compile:
+            fn = _compiled(fn, dynamic=False)
+        return fn(
             x0,
             y0,
             convergence_map,
@@ -360,6 +401,8 @@ class PixelatedConvergence(ThinLens):
             self.n_pix,
             self.padding,
             self.convolution_mode,
+            self.fft_dtype,
+            self._s,
         )
 
     @forward
@@ -609,6 +609,13 @@ class TNFW(ThinLens):
             x0, y0, scale_radius, tau, x, y, M0, d_l, self._F_mode, self.s
         )
 
+    def _physical_deflection_angle(self, x, y, z_s, d_s, d_ls):
+        """
+        The physical deflection angle is computed directly for this lens, so
+        the precomputed distances are not needed.
+        """
+        return self.physical_deflection_angle(x, y, z_s)
+
     @forward
     def potential(
         self,
@@ -84,11 +84,11 @@ def pixel_magnification(raytrace, x, y, z_s) -> Tensor:
     return 1 / (jac[0][0] * jac[1][1] - jac[0][1] * jac[1][0]).abs()  # fmt: skip
 
 
-def magnification(raytrace, x, y, z_s) -> Tensor:
+def magnification(raytrace, x, y, z_s, chunk_size=None) -> Tensor:
     """
     Computes the magnification over a grid on the lensing plane.
-    This is done by calling `pixel_magnification`
-    for each point on the grid.
+    This is done by vectorizing `pixel_magnification`
+    over all points on the grid.
 
     Parameters
     ----------
@@ -110,6 +110,10 @@ def magnification(raytrace, x, y, z_s) -> Tensor:
 
         *Unit: unitless*
 
+    chunk_size: Optional[int]
+        Number of points to evaluate per vectorized call. Limits peak
+        memory for dense grids. Defaults to None, evaluating all points at once.
+
     Returns
     --------
     Tensor
@@ -119,8 +123,8 @@ def magnification(raytrace, x, y, z_s) -> Tensor:
 
     """
     return torch.reshape(
-        torch.func.vmap(pixel_magnification, in_dims=(None, 0, 0, None))(
-            raytrace, x.reshape(-1), y.reshape(-1), z_s
-        ),
+        torch.func.vmap(
+            pixel_magnification, in_dims=(None, 0, 0, None), chunk_size=chunk_size
+        )(raytrace, x.reshape(-1), y.reshape(-1), z_s),
         x.shape,
     )
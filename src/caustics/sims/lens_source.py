@@ -380,7 +380,7 @@ class LensSource(Module):
             if self.psf_mode == "fft":
                 mu_fft = self._fft2_padded(mu)
                 psf_fft = self._fft2_padded(psf / psf.sum())
-                mu = self._unpad_fft(torch.fft.irfft2(mu_fft * psf_fft, self._s).real)
+                mu = self._unpad_fft(torch.fft.irfft2(mu_fft * psf_fft, self._s))
             elif self.psf_mode == "conv2d":
                 mu = (
                     conv2d(
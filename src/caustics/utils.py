@@ -197,6 +197,29 @@ def meshgrid(
     return torch.meshgrid([xs, ys], indexing="xy")
 
 
+@lru_cache(maxsize=None)
+def _compiled(fn: Callable, dynamic: bool) -> Callable:
+    """
+    Return ``fn`` wrapped with ``torch.compile``, built once per function.
+
+    Lenses look their compiled kernels up here at call time rather than
+    storing the wrappers as attributes, which would make them unpicklable.
+
+    Parameters
+    ----------
+    fn : Callable
+        The function to compile.
+    dynamic : bool
+        Passed to ``torch.compile``.
+
+    Returns
+    -------
+    Callable
+        The compiled function.
+    """
+    return torch.compile(fn, dynamic=dynamic)
+
+
 @lru_cache(maxsize=32)
 def _quad_table(n, p, dtype, device):
     """
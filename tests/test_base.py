@@ -2,7 +2,8 @@ import torch
 import numpy as np
 
 from caustics.cosmology import FlatLambdaCDM
-from caustics.lenses import SIE
+from caustics.lenses import SIE, NFW
+from caustics.utils import meshgrid
 from caustics import test as mini_test
 
 
@@ -77,6 +78,35 @@ def test_magnification(device):
     assert np.all(np.isfinite(mag.detach().cpu().numpy()))
     assert np.all(mag.detach().cpu().numpy() > 0)
 
+    mag_chunked = lens.magnification(x, y, z_s, chunk_size=7)
+
+    assert torch.allclose(mag, mag_chunked)
+
+
+def test_raytrace_batched(device):
+    z_s = torch.tensor([0.8, 1.5, 2.5], dtype=torch.float32, device=device)
+
+    cosmology = FlatLambdaCDM(name="cosmo")
+    lens = NFW(
+        name="nfw",
+        cosmology=cosmology,
+        z_l=torch.tensor(0.5),
+        x0=torch.tensor(0.1),
+        y0=torch.tensor(-0.2),
+        m=torch.tensor(1e13),
+        c=torch.tensor(8.0),
+    )
+    lens = lens.to(device)
+    x, y = meshgrid(0.1, 10, device=device)
+
+    bx, by = lens.raytrace_batched(x, y, z_s)
+
+    assert bx.shape == (3, 10, 10)
+    for i in range(len(z_s)):
+        bx_i, by_i = lens.raytrace(x, y, z_s[i])
+        assert torch.allclose(bx[i], bx_i)
+        assert torch.allclose(by[i], by_i)
+
 
 def test_quicktest(device):
     """
@@ -1,5 +1,8 @@
 from io import StringIO
+import pickle
+import sys
 
+import pytest
 import torch
 from lenstronomy.LensModel.lens_model import LensModel
 
@@ -7,6 +10,7 @@ from utils import lens_test_helper
 from caustics.cosmology import FlatLambdaCDM
 from caustics.lenses import ExternalShear
 from caustics.sims import build_simulator
+from caustics.utils import meshgrid
 
 
 def test(sim_source, device):
@@ -50,3 +54,35 @@ def test(sim_source, device):
     lens_test_helper(
         lens, lens_ls, z_s, x, kwargs_ls, rtol, atol, test_kappa=False, device=device
     )
+
+
+@pytest.mark.skipif(
+    sys.platform == "win32", reason="torch.compile needs a C++ toolchain on Windows"
+)
+def test_compiled_matches_eager(device):
+    cosmology = FlatLambdaCDM(name="cosmo")
+    lens = ExternalShear(name="shear", cosmology=cosmology, z_l=0.5)
+    lens_compiled = ExternalShear(
+        name="shear_compiled", cosmology=cosmology, z_l=0.5, use_torch_compile=True
+    )
+    lens.to(device=device)
+    lens_compiled.to(device=device)
+
+    z_s = torch.tensor(2.0, device=device)
+    x = torch.tensor([0.12, -0.52, -0.1, 0.1], device=device)
+    thx, thy = meshgrid(0.05, 20, device=device)
+
+    ax, ay = lens.reduced_deflection_angle(thx, thy, z_s, x)
+    ax_c, ay_c = lens_compiled.reduced_deflection_angle(thx, thy, z_s, x)
+    assert torch.allclose(ax, ax_c)
+    assert torch.allclose(ay, ay_c)
+    assert torch.allclose(
+        lens.potential(thx, thy, z_s, x), lens_compiled.potential(thx, thy, z_s, x)
+    )
+
+    # The compiled kernels are not stored on the lens, so it can still be
+    # sent to worker processes
+    lens_unpickled = pickle.loads(pickle.dumps(lens_compiled))
+    assert torch.allclose(
+        ax, lens_unpickled.reduced_deflection_angle(thx, thy, z_s, x)[0]
+    )
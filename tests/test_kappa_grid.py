@@ -1,3 +1,7 @@
+import pickle
+import sys
+
+import pytest
 import torch
 
 from caustics.cosmology import FlatLambdaCDM
@@ -5,7 +9,9 @@ from caustics.lenses import PixelatedConvergence, PseudoJaffe
 from caustics.utils import meshgrid
 
 
-def _setup(n_pix, mode, use_next_fast_len, padding="zero", device=None):
+def _setup(
+    n_pix, mode, use_next_fast_len, padding="zero", use_torch_compile=False, device=None
+):
     # TODO understand why this test fails for resolutions != 0.025
     res = 0.025
     thx, thy = meshgrid(res, n_pix, device=device)
@@ -54,6 +60,7 @@ def _setup(n_pix, mode, use_next_fast_len, padding="zero", device=None):
         use_next_fast_len=use_next_fast_len,
         name="kg",
         padding=padding,
+        use_torch_compile=use_torch_compile,
     )
     lens_kap.to(device=device)
     kappa_map = lens_pj.convergence(thx, thy, z_s, x_pj)
@@ -124,6 +131,75 @@ def test_padoptions(device):
     assert torch.allclose(alpha_y_fft_circ, alpha_y_fft_tile, atol=1e-20, rtol=0)
 
 
+@pytest.mark.skipif(
+    sys.platform == "win32", reason="torch.compile needs a C++ toolchain on Windows"
+)
+def test_torch_compile(device):
+    """
+    Checks whether the compiled deflection angle and potential match eager mode.
+    """
+    _, Psi_eager, _, alpha_x_eager, _, alpha_y_eager = _setup(
+        100, "fft", True, device=device
+    )
+    _, Psi_compiled, _, alpha_x_compiled, _, alpha_y_compiled = _setup(
+        100, "fft", True, use_torch_compile=True, device=device
+    )
+    assert torch.allclose(Psi_eager, Psi_compiled)
+    assert torch.allclose(alpha_x_eager, alpha_x_compiled)
+    assert torch.allclose(alpha_y_eager, alpha_y_compiled)
+
+
+@pytest.mark.skipif(
+    sys.platform == "win32", reason="torch.compile needs a C++ toolchain on Windows"
+)
+def test_torch_compile_coordinate_shapes(device):
+    """
+    Checks that a compiled lens stays correct when called on coordinates of
+    different shapes, which recompiles the shared compiled functions.
+    """
+    kwargs = dict(z_l=0.5, shape=(16, 16), name="kg")
+    cosmology = FlatLambdaCDM(name="cosmology")
+    lens = PixelatedConvergence(0.05, cosmology, **kwargs)
+    lens_compiled = PixelatedConvergence(
+        0.05, cosmology, use_torch_compile=True, **kwargs
+    )
+    lens.to(device=device)
+    lens_compiled.to(device=device)
+
+    z_s = torch.tensor(1.5, device=device)
+    thx, thy = meshgrid(0.05, 16, device=device)
+    kappa_map = torch.exp(-(thx**2 + thy**2) / 0.1)
+    params = kappa_map.flatten()
+    for x, y in [(thx, thy), (thx[:5, :3], thy[:5, :3])]:
+        ax, ay = lens.reduced_deflection_angle(x, y, z_s, params)
+        ax_c, ay_c = lens_compiled.reduced_deflection_angle(x, y, z_s, params)
+        assert ax_c.shape == x.shape
+        assert torch.allclose(ax, ax_c)
+        assert torch.allclose(ay, ay_c)
+        assert torch.allclose(
+            lens.potential(x, y, z_s, params),
+            lens_compiled.potential(x, y, z_s, params),
+        )
+
+
+def test_pickle(device):
+    """
+    Checks that a lens using `torch.compile` can still be pickled.
+    """
+    lens = PixelatedConvergence(
+        0.05,
+        FlatLambdaCDM(name="cosmology"),
+        z_l=0.5,
+        shape=(16, 16),
+        use_torch_compile=True,
+        name="kg",
+    )
+    lens.to(device=device)
+    lens_unpickled = pickle.loads(pickle.dumps(lens))
+    assert lens_unpickled.use_torch_compile
+    assert torch.allclose(lens_unpickled.ax_kernel_tilde, lens.ax_kernel_tilde)
+
+
 def _check_center(
     x, x_approx, center_c, center_r, rtol=1e-5, atol=1e-8, half_buffer=20
 ):
@@ -145,3 +221,35 @@ def _check_center(
         rtol,
         atol,
     )
+
+
+def test_low_precision_fft(device):
+    """
+    Checks that a float64 lens with a float32 FFT matches full precision.
+    """
+    n_pix = 64
+    thx, thy = meshgrid(0.05, n_pix, device=device, dtype=torch.float64)
+    z_s = torch.tensor(1.5, device=device, dtype=torch.float64)
+    kappa_map = torch.exp(-(thx**2 + thy**2) / 0.5)
+
+    results = []
+    for low_precision_fft in [False, True]:
+        lens = PixelatedConvergence(
+            0.05,
+            FlatLambdaCDM(name="cosmology"),
+            z_l=0.5,
+            convergence_map=kappa_map,
+            low_precision_fft=low_precision_fft,
+            name="kg",
+        )
+        lens.to(device=device, dtype=torch.float64)
+        results.append(
+            (
+                *lens.reduced_deflection_angle(thx, thy, z_s),
+                lens.potential(thx, thy, z_s),
+            )
+        )
+
+    for full, low in zip(*results):
+        assert low.dtype == torch.float64
+        assert torch.allclose(full, low, rtol=1e-4, atol=1e-6)
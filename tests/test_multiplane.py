@@ -1,4 +1,5 @@
 from math import pi
+import warnings
 
 import lenstronomy.Util.param_util as param_util
 import torch
@@ -136,6 +137,32 @@ def test_multiplane_time_delay(device):
     )
 
 
+def test_reduced_deflection_angle_warns_once(device):
+    z_s = torch.tensor(1.5, dtype=torch.float32, device=device)
+    cosmology = FlatLambdaCDM(name="cosmo")
+    cosmology.to(dtype=torch.float32, device=device)
+    thx, thy = meshgrid(0.05, 10, dtype=torch.float32, device=device)
+
+    xs = [
+        [0.5, 0.9, -0.4, 0.9999, 3 * pi / 4, 0.8],
+        [0.7, 0.0, 0.5, 0.9999, -pi / 6, 0.7],
+    ]
+    x = torch.tensor(xs, dtype=torch.float32, device=device).flatten()
+
+    lens = Multiplane(
+        name="multiplane",
+        cosmology=cosmology,
+        lenses=[SIE(name=f"sie_{i}", cosmology=cosmology) for i in range(len(xs))],
+    )
+    lens.to(device=device)
+
+    with pytest.warns(UserWarning):
+        lens.reduced_deflection_angle(thx, thy, z_s, x)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        lens.reduced_deflection_angle(thx, thy, z_s, x)
+
+
 def test_params(device):
     z_s = 1
     n_planes = 10